@@ -14,7 +14,8 @@
 import operator
 import os
 import sys
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 import pytest
 import torch
@@ -28,6 +29,11 @@ from lightning.fabric.strategies.deepspeed import _DEEPSPEED_AVAILABLE
 from lightning.fabric.utilities.imports import _TORCH_GREATER_EQUAL_2_1
 
 
+@lru_cache()
+def _compare_torch_version(op: Callable[[Any, Any], bool], version: str, use_base_version: bool = False) -> bool:
+    return compare_version("torch", op, version, use_base_version=use_base_version)
+
+
 def _RunIf(
     *args: Any,
     min_cuda_gpus: int = 0,
@@ -80,12 +86,12 @@ def _RunIf(
 
     if min_torch:
         # set use_base_version for nightly support
-        conditions.append(compare_version("torch", operator.lt, min_torch, use_base_version=True))
+        conditions.append(_compare_torch_version(operator.lt, min_torch, use_base_version=True))
         reasons.append(f"torch>={min_torch}, {torch.__version__} installed")
 
     if max_torch:
         # set use_base_version for nightly support
-        conditions.append(compare_version("torch", operator.ge, max_torch, use_base_version=True))
+        conditions.append(_compare_torch_version(operator.ge, max_torch, use_base_version=True))
         reasons.append(f"torch<{max_torch}, {torch.__version__} installed")
 
     if min_python:
@@ -145,7 +151,7 @@ def _RunIf(
             cond = sys.platform == "win32" or sys.version_info >= (3, 11)
 
         # set use_base_version for nightly support
-        cond |= compare_version("torch", operator.lt, "2.0.0", use_base_version=True)
+        cond |= _compare_torch_version(operator.lt, "2.0.0", use_base_version=True)
         conditions.append(cond)
         reasons.append("torch.dynamo")
 
@@ -14,7 +14,8 @@
 import operator
 import os
 import sys
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 import torch
 from lightning_utilities.core.imports import compare_version, RequirementCache
@@ -33,6 +34,11 @@ from lightning.pytorch.utilities.imports import _IPU_AVAILABLE, _OMEGACONF_AVAIL
 _SKLEARN_AVAILABLE = RequirementCache("scikit-learn")
 
 
+@lru_cache()
+def _compare_torch_version(op: Callable[[Any, Any], bool], version: str, use_base_version: bool = False) -> bool:
+    return compare_version("torch", op, version, use_base_version=use_base_version)
+
+
 def _RunIf(
     min_cuda_gpus: int = 0,
     min_torch: Optional[str] = None,
@@ -95,12 +101,12 @@ def _RunIf(
 
     if min_torch:
         # set use_base_version for nightly support
-        conditions.append(compare_version("torch", operator.lt, min_torch, use_base_version=True))
+        conditions.append(_compare_torch_version(operator.lt, min_torch, use_base_version=True))
         reasons.append(f"torch>={min_torch}, {torch.__version__} installed")
 
     if max_torch:
         # set use_base_version for nightly support
-        conditions.append(compare_version("torch", operator.ge, max_torch, use_base_version=True))
+        conditions.append(_compare_torch_version(operator.ge, max_torch, use_base_version=True))
         reasons.append(f"torch<{max_torch}, {torch.__version__} installed")
 
     if min_python:
@@ -186,7 +192,7 @@ def _RunIf(
             cond = sys.platform == "win32" or sys.version_info >= (3, 11)
 
         # set use_base_version for nightly support
-        cond |= compare_version("torch", operator.lt, "2.0.0", use_base_version=True)
+        cond |= _compare_torch_version(operator.lt, "2.0.0", use_base_version=True)
         conditions.append(cond)
         reasons.append("torch.dynamo")
 
@@ -32,6 +32,12 @@ if _TORCH_GREATER_EQUAL_1_12:
     from torch.distributed.fsdp.fully_sharded_data_parallel import CPUOffload, FullyShardedDataParallel, MixedPrecision
 
 
+@pytest.fixture(scope="module")
+def default_strategy():
+    """A default ``FSDPStrategy`` shared across the tests in this module that don't modify its state."""
+    return FSDPStrategy()
+
+
 @mock.patch("lightning.fabric.strategies.fsdp._TORCH_GREATER_EQUAL_1_12", False)
 def test_fsdp_support(*_):
     with pytest.raises(NotImplementedError, match="`FSDPStrategy` is supported from PyTorch v1.12.0"):
@@ -99,20 +105,19 @@ def test_fsdp_setup_use_orig_params(_):
 
 
 @RunIf(min_torch="1.12")
-def test_fsdp_no_backward_sync():
+def test_fsdp_no_backward_sync(default_strategy):
     """Test that the backward sync control calls `.no_sync()`, and only on a module wrapped in
     FullyShardedDataParallel."""
 
-    strategy = FSDPStrategy()
-    assert isinstance(strategy._backward_sync_control, _FSDPBackwardSyncControl)
+    assert isinstance(default_strategy._backward_sync_control, _FSDPBackwardSyncControl)
 
     with pytest.raises(
         TypeError, match="is only possible if the module passed to .* is wrapped in `FullyShardedDataParallel`"
-    ), strategy._backward_sync_control.no_backward_sync(Mock()):
+    ), default_strategy._backward_sync_control.no_backward_sync(Mock()):
         pass
 
     module = MagicMock(spec=FullyShardedDataParallel)
-    with strategy._backward_sync_control.no_backward_sync(module):
+    with default_strategy._backward_sync_control.no_backward_sync(module):
         pass
 
     module.no_sync.assert_called_once()
@@ -160,8 +165,7 @@ def test_fsdp_activation_checkpointing():
 
 
 @RunIf(min_torch="1.13")
-def test_fsdp_grad_clipping_value_error():
-    strategy = FSDPStrategy()
+def test_fsdp_grad_clipping_value_error(default_strategy):
     with pytest.raises(
         NotImplementedError,
         match=(
@@ -169,7 +173,7 @@ def test_fsdp_grad_clipping_value_error():
             "Consider clipping by norm instead or choose another strategy!"
         ),
     ):
-        strategy.clip_gradients_value(Mock(), Mock(), Mock())
+        default_strategy.clip_gradients_value(Mock(), Mock(), Mock())
 
 
 class _MyFSDPFabricGradientNorm(_MyFabricGradNorm):
@@ -197,70 +201,75 @@ def test_fsdp_grad_clipping_norm(precision):
 
 
 @RunIf(min_torch="2.0.0")
-def test_fsdp_save_checkpoint_storage_options(tmp_path):
+def test_fsdp_save_checkpoint_storage_options(tmp_path, default_strategy):
     """Test that the FSDP strategy does not accept storage options for saving checkpoints."""
-    strategy = FSDPStrategy()
     with pytest.raises(TypeError, match=escape("FSDPStrategy.save_checkpoint(..., storage_options=...)` is not")):
-        strategy.save_checkpoint(path=tmp_path, state=Mock(), storage_options=Mock())
+        default_strategy.save_checkpoint(path=tmp_path, state=Mock(), storage_options=Mock())
 
 
 @RunIf(min_torch="2.0.0")
 @mock.patch("lightning.fabric.strategies.fsdp.FSDPStrategy.broadcast", lambda _, x: x)
-def test_fsdp_save_checkpoint_folder_exists(tmp_path):
+def test_fsdp_save_checkpoint_folder_exists(tmp_path, default_strategy):
     path = tmp_path / "exists"
     path.mkdir()
     (path / "file").touch()
-    strategy = FSDPStrategy()
     with pytest.raises(FileExistsError, match="exists and is not empty"):
-        strategy.save_checkpoint(path=path, state=Mock())
-
-
-@RunIf(min_torch="2.0.0")
-@mock.patch("lightning.fabric.strategies.fsdp.FSDPStrategy.broadcast", lambda _, x: x)
-def test_fsdp_save_checkpoint_one_fsdp_module_required(tmp_path):
-    """Test that the FSDP strategy can only save one FSDP model per checkpoint."""
-    strategy = FSDPStrategy()
-
-    # missing FSDP model
-    with pytest.raises(ValueError, match="Could not find a FSDP model in the provided checkpoint state."):
-        strategy.save_checkpoint(path=tmp_path, state={})
-    with pytest.raises(ValueError, match="Could not find a FSDP model in the provided checkpoint state."):
-        strategy.save_checkpoint(path=tmp_path, state={"model": torch.nn.Linear(3, 3)})
-
-    # multiple FSDP models
-    model1 = Mock(spec=FullyShardedDataParallel)
-    model2 = Mock(spec=FullyShardedDataParallel)
-    with pytest.raises(ValueError, match="Found multiple FSDP modules in the given state."):
-        strategy.save_checkpoint(path=tmp_path, state={"model1": model1, "model2": model2})
+        default_strategy.save_checkpoint(path=path, state=Mock())
 
 
 @RunIf(min_torch="2.0.0")
-def test_fsdp_load_checkpoint_no_state(tmp_path):
+def test_fsdp_load_checkpoint_no_state(tmp_path, default_strategy):
     """Test that the FSDP strategy can't load the full state without access to a model instance from the user."""
-    strategy = FSDPStrategy()
     with pytest.raises(ValueError, match=escape("Got FSDPStrategy.load_checkpoint(..., state=None")):
-        strategy.load_checkpoint(path=tmp_path, state=None)
+        default_strategy.load_checkpoint(path=tmp_path, state=None)
     with pytest.raises(ValueError, match=escape("Got FSDPStrategy.load_checkpoint(..., state={})")):
-        strategy.load_checkpoint(path=tmp_path, state={})
+        default_strategy.load_checkpoint(path=tmp_path, state={})
 
 
 @RunIf(min_torch="2.0.0")
+@pytest.mark.parametrize(
+    ("method", "state", "match"),
+    [
+        # missing FSDP model (loading with an empty state fails earlier, see `test_fsdp_load_checkpoint_no_state`)
+        pytest.param("save_checkpoint", lambda: {}, "Could not find a FSDP model", id="save-empty-dict"),
+        pytest.param(
+            "save_checkpoint", lambda: {"other": "data"}, "Could not find a FSDP model", id="save-no-fsdp-dict"
+        ),
+        pytest.param(
+            "load_checkpoint", lambda: {"other": "data"}, "Could not find a FSDP model", id="load-no-fsdp-dict"
+        ),
+        pytest.param(
+            "save_checkpoint",
+            lambda: {"model": torch.nn.Linear(3, 3)},
+            "Could not find a FSDP model",
+            id="save-plain-module",
+        ),
+        pytest.param(
+            "load_checkpoint",
+            lambda: {"model": torch.nn.Linear(3, 3)},
+            "Could not find a FSDP model",
+            id="load-plain-module",
+        ),
+        # multiple FSDP models
+        pytest.param(
+            "save_checkpoint",
+            lambda: {"model1": Mock(spec=FullyShardedDataParallel), "model2": Mock(spec=FullyShardedDataParallel)},
+            "Found multiple FSDP modules",
+            id="save-multiple-fsdp",
+        ),
+        pytest.param(
+            "load_checkpoint",
+            lambda: {"model1": Mock(spec=FullyShardedDataParallel), "model2": Mock(spec=FullyShardedDataParallel)},
+            "Found multiple FSDP modules",
+            id="load-multiple-fsdp",
+        ),
+    ],
+)
 @mock.patch("lightning.fabric.strategies.fsdp.FSDPStrategy.broadcast", lambda _, x: x)
-def test_fsdp_load_checkpoint_one_fsdp_module_required(tmp_path):
-    """Test that the FSDP strategy can only load one FSDP model per checkpoint."""
-    strategy = FSDPStrategy()
-
-    # missing FSDP model
-    with pytest.raises(ValueError, match="Could not find a FSDP model in the provided checkpoint state."):
-        strategy.load_checkpoint(path=tmp_path, state={"other": "data"})
-    with pytest.raises(ValueError, match="Could not find a FSDP model in the provided checkpoint state."):
-        strategy.load_checkpoint(path=tmp_path, state={"model": torch.nn.Linear(3, 3)})
-
-    # multiple FSDP models
-    model1 = Mock(spec=FullyShardedDataParallel)
-    model2 = Mock(spec=FullyShardedDataParallel)
-    with pytest.raises(ValueError, match="Found multiple FSDP modules in the given state."):
-        strategy.load_checkpoint(path=tmp_path, state={"model1": model1, "model2": model2})
+def test_fsdp_checkpoint_fsdp_module_required(method, state, match, tmp_path, default_strategy):
+    """Test that the FSDP strategy can only save and load one FSDP model per checkpoint."""
+    with pytest.raises(ValueError, match=match):
+        getattr(default_strategy, method)(path=tmp_path, state=state())
 
 
 @RunIf(min_torch="1.12")